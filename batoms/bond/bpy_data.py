@@ -1,3 +1,4 @@
+from operator import attrgetter
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -48,33 +49,38 @@ class BondSetting(Base):
     )
     type: IntProperty(name="type", default=0)
 
+    _FIELDS = (
+        "flag",
+        "label",
+        "species1",
+        "species2",
+        "species",
+        "name",
+        "min",
+        "max",
+        "search",
+        "polyhedra",
+        "material_style",
+        "color1",
+        "color2",
+        "width",
+        "order",
+        "order_offset",
+        "style",
+        "type",
+    )
+    _values = attrgetter(*_FIELDS)
+
     @property
     def name(self) -> str:
-        return "%s-%s" % (self.species1, self.species2)
+        return f"{self.species1}-{self.species2}"
 
     def as_dict(self, reversed=False) -> dict:
-        setdict = {
-            "flag": self.flag,
-            "label": self.label,
-            "species1": self.species1,
-            "species2": self.species2,
-            "species": self.species,
-            "name": self.name,
-            "min": self.min,
-            "max": self.max,
-            "search": self.search,
-            "polyhedra": self.polyhedra,
-            "material_style": self.material_style,
-            "color1": self.color1[:],
-            "color2": self.color2[:],
-            "width": self.width,
-            "order": self.order,
-            "order_offset": self.order_offset,
-            "style": self.style,
-            "type": self.type,
-        }
+        setdict = dict(zip(self._FIELDS, self._values(self)))
+        setdict["color1"] = self.color1[:]
+        setdict["color2"] = self.color2[:]
         if reversed:
-            setdict["name"] = "%s-%s" % (self.species2, self.species1)
+            setdict["name"] = f"{self.species2}-{self.species1}"
             setdict["species1"] = self.species2
             setdict["species2"] = self.species1
             setdict["color1"] = self.color2[:]
@@ -82,10 +88,10 @@ class BondSetting(Base):
         return setdict
 
     def __repr__(self) -> str:
-        s = "-" * 60 + "\n"
         s = "Bondpair   min     max   Search_bond    Polyhedra \n"
-        s += "{:10s} {:4.3f}   {:4.3f}      {:10s}   {:10s} \n".format(
-            self.name, self.min, self.max, str(self.search), str(self.polyhedra)
+        s += (
+            f"{self.name:10s} {self.min:4.3f}   {self.max:4.3f}      "
+            f"{str(self.search):10s}   {str(self.polyhedra):10s} \n"
         )
         s += "-" * 60 + "\n"
         return s
@@ -42,9 +42,7 @@ classes = [
     view3d_mt_batoms_add.VIEW3D_MT_surface_add,
     view3d_mt_batoms_add.VIEW3D_MT_nanotube_add,
     view3d_mt_batoms_add.VIEW3D_MT_nanoparticle_add,
-    view3d_mt_object_context_menu.VIEW3D_MT_object_context_batoms_model_style,
-    view3d_mt_object_context_menu.VIEW3D_MT_object_context_batoms_radius_style,
-    view3d_mt_object_context_menu.VIEW3D_MT_object_context_batoms_color_style,
+    *view3d_mt_object_context_menu.style_menus,
     view3d_mt_object_context_menu.VIEW3D_MT_object_context_batoms_label,
     view3d_mt_object_context_menu.VIEW3D_MT_object_context_batoms,
     view3d_mt_object_context_menu.VIEW3D_MT_object_context_bonds,
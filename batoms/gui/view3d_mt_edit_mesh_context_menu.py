@@ -2,6 +2,8 @@
 """
 
 from bpy.types import Menu
+from ..internal_data import MODEL_STYLE_ITEMS
+from .view3d_mt_object_context_menu import _draw_items
 
 
 def menu_func(self, context):
@@ -13,27 +15,13 @@ class VIEW3D_MT_edit_mesh_context_batoms_model_style(Menu):
     bl_label = "model style"
     # bl_icon = ""
 
-    def draw(self, context):
-        (
-            is_vert_mode,
-            is_edge_mode,
-            is_face_mode,
-        ) = context.tool_settings.mesh_select_mode
-
-        layout = self.layout
-
-        layout.operator_context = "INVOKE_REGION_WIN"
-
-        op0 = layout.operator("batoms.apply_model_style_selected", text="Space-filling")
-        op0.model_style = "0"
-        op1 = layout.operator(
-            "batoms.apply_model_style_selected", text="Ball-and-stick"
+    def draw(self, _context):
+        _draw_items(
+            self.layout,
+            "batoms.apply_model_style_selected",
+            "model_style",
+            MODEL_STYLE_ITEMS,
         )
-        op1.model_style = "1"
-        op2 = layout.operator("batoms.apply_model_style_selected", text="Polyhedral")
-        op2.model_style = "2"
-        op3 = layout.operator("batoms.apply_model_style_selected", text="Stick")
-        op3.model_style = "3"
 
 
 class VIEW3D_MT_edit_mesh_context_batoms(Menu):
@@ -2,6 +2,11 @@
 """
 
 from bpy.types import Menu
+from ..internal_data import (
+    MODEL_STYLE_ITEMS,
+    RADIUS_STYLE_ITEMS,
+    COLOR_STYLE_ITEMS,
+)
 
 
 def menu_func(self, context):
@@ -9,60 +14,57 @@ def menu_func(self, context):
     self.layout.menu("VIEW3D_MT_object_context_bonds", icon="MESH_UVSPHERE")
 
 
-class VIEW3D_MT_object_context_batoms_model_style(Menu):
-    bl_idname = "VIEW3D_MT_object_context_batoms_model_style"
-    bl_label = "model style"
-    # bl_icon = ""
-
-    def draw(self, _context):
-        layout = self.layout
-
-        layout.operator_context = "INVOKE_REGION_WIN"
-
-        op0 = layout.operator("batoms.apply_model_style", text="Space-filling")
-        op0.model_style = "0"
-        op1 = layout.operator("batoms.apply_model_style", text="Ball-and-stick")
-        op1.model_style = "1"
-        op2 = layout.operator("batoms.apply_model_style", text="Polyhedral")
-        op2.model_style = "2"
-        op3 = layout.operator("batoms.apply_model_style", text="Stick")
-        op3.model_style = "3"
-
-
-class VIEW3D_MT_object_context_batoms_radius_style(Menu):
-    bl_idname = "VIEW3D_MT_object_context_batoms_radius_style"
-    bl_label = "model style"
-    # bl_icon = ""
+def _draw_items(layout, op_idname, prop, items):
+    """Add one operator entry per enum item, setting prop to its identifier."""
+    layout.operator_context = "INVOKE_REGION_WIN"
 
-    def draw(self, _context):
-        layout = self.layout
-
-        layout.operator_context = "INVOKE_REGION_WIN"
-
-        op0 = layout.operator("batoms.apply_radius_style", text="Covalent")
-        op0.radius_style = "0"
-        op1 = layout.operator("batoms.apply_radius_style", text="VDW")
-        op1.radius_style = "1"
-        op2 = layout.operator("batoms.apply_radius_style", text="Ionic")
-        op2.radius_style = "2"
+    operator = layout.operator
+    for value, text, _description in items:
+        setattr(operator(op_idname, text=text), prop, value)
 
 
-class VIEW3D_MT_object_context_batoms_color_style(Menu):
-    bl_idname = "VIEW3D_MT_object_context_batoms_color_style"
-    bl_label = "model style"
-    # bl_icon = ""
+def _make_style_menu(idname, label, op_idname, prop, items):
+    """Create a Menu subclass applying a style operator with the given items."""
 
     def draw(self, _context):
-        layout = self.layout
-
-        layout.operator_context = "INVOKE_REGION_WIN"
-
-        op0 = layout.operator("batoms.apply_color_style", text="JMOL")
-        op0.color_style = "0"
-        op1 = layout.operator("batoms.apply_color_style", text="VESTA")
-        op1.color_style = "1"
-        op2 = layout.operator("batoms.apply_color_style", text="CPK")
-        op2.color_style = "2"
+        _draw_items(self.layout, op_idname, prop, items)
+
+    return type(
+        idname,
+        (Menu,),
+        {"bl_idname": idname, "bl_label": label, "draw": draw},
+    )
+
+
+VIEW3D_MT_object_context_batoms_model_style = _make_style_menu(
+    "VIEW3D_MT_object_context_batoms_model_style",
+    "model style",
+    "batoms.apply_model_style",
+    "model_style",
+    MODEL_STYLE_ITEMS,
+)
+
+VIEW3D_MT_object_context_batoms_radius_style = _make_style_menu(
+    "VIEW3D_MT_object_context_batoms_radius_style",
+    "radius style",
+    "batoms.apply_radius_style",
+    "radius_style",
+    RADIUS_STYLE_ITEMS,
+)
+
+VIEW3D_MT_object_context_batoms_color_style = _make_style_menu(
+    "VIEW3D_MT_object_context_batoms_color_style",
+    "color style",
+    "batoms.apply_color_style",
+    "color_style",
+    COLOR_STYLE_ITEMS,
+)
+
+style_menus = (
+    VIEW3D_MT_object_context_batoms_model_style,
+    VIEW3D_MT_object_context_batoms_radius_style,
+    VIEW3D_MT_object_context_batoms_color_style,
+)
 
 
 class VIEW3D_MT_object_context_batoms_label(Menu):
@@ -3,7 +3,12 @@ from bpy.props import (
 )
 from . import bpy_data
 from bpy.types import Collection, Object
-from .bpy_data import Base
+from .bpy_data import (
+    Base,
+    MODEL_STYLE_ITEMS,
+    RADIUS_STYLE_ITEMS,
+    COLOR_STYLE_ITEMS,
+)
 
 classes = [
     bpy_data.Belement,
@@ -19,7 +24,14 @@ classes = [
 ]
 
 
-__all__ = ["register_class", "unregister_class", "Base"]
+__all__ = [
+    "register_class",
+    "unregister_class",
+    "Base",
+    "MODEL_STYLE_ITEMS",
+    "RADIUS_STYLE_ITEMS",
+    "COLOR_STYLE_ITEMS",
+]
 
 
 def register_class():
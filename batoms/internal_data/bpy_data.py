@@ -12,6 +12,31 @@ from bpy.props import (
     CollectionProperty,
 )
 
+# Enum items shared by the style properties, operators and context menus
+MODEL_STYLE_ITEMS = (
+    ("0", "Space-filling", "Use ball and stick"),
+    ("1", "Ball-and-stick", "Use ball"),
+    ("2", "Polyhedral", "Use polyhedral"),
+    ("3", "Stick", "Use stick"),
+)
+RADIUS_STYLE_ITEMS = (
+    ("0", "Covalent", "Covalent"),
+    ("1", "VDW", "van der Waals"),
+    ("2", "Ionic", "Ionic"),
+)
+COLOR_STYLE_ITEMS = (
+    ("0", "JMOL", "JMOL"),
+    ("1", "VESTA", "VESTA"),
+    ("2", "CPK", "CPK"),
+)
+# Stored on Bselect and BatomsCollection, where item "3" is the wireframe model
+BATOMS_MODEL_STYLE_ITEMS = (
+    ("0", "Space-filling", "Use ball"),
+    ("1", "Ball-and-stick", "Use ball and stick"),
+    ("2", "Polyhedral", "Use polyhedral"),
+    ("3", "Wireframe", "Use wireframe"),
+)
+
 
 def get_volumetric_data(self, context):
     keys = bpy.data.collections[
@@ -97,11 +122,7 @@ class Batom(bpy.types.PropertyGroup):
     radii_style: EnumProperty(
         name="radii_style",
         description="Radii",
-        items=(
-            ("0", "Covalent", "covalent"),
-            ("1", "VDW", "van der Waals"),
-            ("2", "Ionic", "ionic"),
-        ),
+        items=RADIUS_STYLE_ITEMS,
         default="0",
     )
 
@@ -296,22 +317,13 @@ class Bselect(bpy.types.PropertyGroup):
     model_style: EnumProperty(
         name="model_style",
         description="Structural models",
-        items=(
-            ("0", "Space-filling", "Use ball"),
-            ("1", "Ball-and-stick", "Use ball and stick"),
-            ("2", "Polyhedral", "Use polyhedral"),
-            ("3", "Wireframe", "Use wireframe"),
-        ),
+        items=BATOMS_MODEL_STYLE_ITEMS,
         default="0",
     )
     radius_style: EnumProperty(
         name="radius_style",
         description="Radii",
-        items=(
-            ("0", "Covalent", "covalent"),
-            ("1", "VDW", "van der Waals"),
-            ("2", "Ionic", "ionic"),
-        ),
+        items=RADIUS_STYLE_ITEMS,
         default="0",
     )
     polyhedra_style: EnumProperty(
@@ -367,30 +379,21 @@ class BatomsCollection(bpy.types.PropertyGroup):
     model_style: EnumProperty(
         name="model_style",
         description="Structural models",
-        items=(
-            ("0", "Space-filling", "Use ball"),
-            ("1", "Ball-and-stick", "Use ball and stick"),
-            ("2", "Polyhedral", "Use polyhedral"),
-            ("3", "Wireframe", "Use wireframe"),
-        ),
+        items=BATOMS_MODEL_STYLE_ITEMS,
         default="0",
     )
 
     radius_style: EnumProperty(
         name="radius_style",
         description="Radii",
-        items=(
-            ("0", "Covalent", "covalent"),
-            ("1", "VDW", "van der Waals"),
-            ("2", "Ionic", "ionic"),
-        ),
+        items=RADIUS_STYLE_ITEMS,
         default="0",
     )
 
     color_style: EnumProperty(
         name="color_style",
         description="Color",
-        items=(("0", "JMOL", "JMOL"), ("1", "VESTA", "VESTA"), ("2", "CPK", "CPK")),
+        items=COLOR_STYLE_ITEMS,
         default="0",
     )
 
@@ -10,6 +10,11 @@ from bpy.props import (
     EnumProperty,
 )
 from ..batoms import Batoms
+from ..internal_data import (
+    MODEL_STYLE_ITEMS,
+    RADIUS_STYLE_ITEMS,
+    COLOR_STYLE_ITEMS,
+)
 from ..ops.base import OperatorBatoms, OperatorBatomsEdit
 from ..utils.butils import get_selected_vertices
 
@@ -305,12 +310,7 @@ class ApplyModelStyle(OperatorBatoms):
     model_style: EnumProperty(
         name="model_style",
         description="Structural models",
-        items=[
-            ("0", "Space-filling", "Use ball and stick"),
-            ("1", "Ball-and-stick", "Use ball"),
-            ("2", "Polyhedral", "Use polyhedral"),
-            ("3", "Stick", "Use stick"),
-        ],
+        items=MODEL_STYLE_ITEMS,
         default="0",
     )
 
@@ -337,11 +337,7 @@ class ApplyRadiusStyle(OperatorBatoms):
     radius_style: EnumProperty(
         name="radius_style",
         description="Structural models",
-        items=[
-            ("0", "Covalent", "Covalent"),
-            ("1", "VDW", "van der Waals"),
-            ("2", "Ionic", "Ionic"),
-        ],
+        items=RADIUS_STYLE_ITEMS,
         default="0",
     )
 
@@ -368,7 +364,7 @@ class ApplyColorStyle(OperatorBatoms):
     color_style: EnumProperty(
         name="color_style",
         description="Structural models",
-        items=[("0", "JMOL", "JMOL"), ("1", "VESTA", "VESTA"), ("2", "CPK", "CPK")],
+        items=COLOR_STYLE_ITEMS,
         default="0",
     )
 
@@ -517,12 +513,7 @@ class ApplyModelStyleSelected(OperatorBatoms):
     model_style: EnumProperty(
         name="model_style",
         description="Structural models",
-        items=[
-            ("0", "Space-filling", "Use ball and stick"),
-            ("1", "Ball-and-stick", "Use ball"),
-            ("2", "Polyhedral", "Use polyhedral"),
-            ("3", "Stick", "Use stick"),
-        ],
+        items=MODEL_STYLE_ITEMS,
         default="0",
     )
 
@@ -1,4 +1,5 @@
 import bpy
+from operator import attrgetter
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -69,30 +70,29 @@ class IsosurfaceSetting(Base):
         update=None,
     )
 
+    _FIELDS = (
+        "flag",
+        "label",
+        "name",
+        "volumetric_data",
+        "color_by",
+        "material_style",
+        "color",
+        "level",
+    )
+    _values = attrgetter(*_FIELDS)
+
     def as_dict(self) -> dict:
-        setdict = {
-            "flag": self.flag,
-            "label": self.label,
-            "name": self.name,
-            "volumetric_data": self.volumetric_data,
-            "color_by": self.color_by,
-            "material_style": self.material_style,
-            "color": self.color[:],
-            "level": self.level,
-        }
+        setdict = dict(zip(self._FIELDS, self._values(self)))
+        setdict["color"] = self.color[:]
         return setdict
 
     def __repr__(self) -> str:
-        s = "-" * 60 + "\n"
+        r, g, b, a = self.color
         s = "Name    volumetric_data    level        color            \n"
-        s += "{0:10s}   {1:10s}  {2:1.6f}  [{3:1.2f}  {4:1.2f}  {5:1.2f}   {6:1.2f}] \n".format(
-            self.name,
-            self.volumetric_data,
-            self.level,
-            self.color[0],
-            self.color[1],
-            self.color[2],
-            self.color[3],
+        s += (
+            f"{self.name:10s}   {self.volumetric_data:10s}  {self.level:1.6f}  "
+            f"[{r:1.2f}  {g:1.2f}  {b:1.2f}   {a:1.2f}] \n"
         )
         s += "-" * 60 + "\n"
         return s
@@ -1,4 +1,5 @@
 import bpy
+from operator import attrgetter
 from bpy.props import (
     IntVectorProperty,
     StringProperty,
@@ -62,43 +63,45 @@ class LatticePlaneSetting(Base):
         update=None,
     )
 
+    _FIELDS = (
+        "flag",
+        "label",
+        "name",
+        "material_style",
+        "color_by",
+        "color",
+        "color1",
+        "color2",
+        "indices",
+        "distance",
+        "crystal",
+        "symmetry",
+        "slicing",
+        "boundary",
+        "show_edge",
+        "width",
+    )
+    _values = attrgetter(*_FIELDS)
+
     @property
     def name(self) -> str:
-        return "%s-%s-%s" % (self.indices[0], self.indices[1], self.indices[2])
+        i, j, k = self.indices
+        return f"{i}-{j}-{k}"
 
     def as_dict(self) -> dict:
-        setdict = {
-            "flag": self.flag,
-            "label": self.label,
-            "name": self.name,
-            "material_style": self.material_style,
-            "color_by": self.color_by,
-            "color": self.color[:],
-            "color1": self.color1[:],
-            "color2": self.color2[:],
-            "indices": list(self.indices),
-            "distance": self.distance,
-            "crystal": self.crystal,
-            "symmetry": self.symmetry,
-            "slicing": self.slicing,
-            "boundary": self.boundary,
-            "show_edge": self.show_edge,
-            "width": self.width,
-        }
+        setdict = dict(zip(self._FIELDS, self._values(self)))
+        setdict["color"] = self.color[:]
+        setdict["color1"] = self.color1[:]
+        setdict["color2"] = self.color2[:]
+        setdict["indices"] = list(setdict["indices"])
         return setdict
 
     def __repr__(self) -> str:
-        s = "-" * 60 + "\n"
         s = "Name        distance  crystal symmetry slicing  show_edge  boundary   edgewidth        \n"
-        s += "{0:10s}   {1:1.3f}  {2:8s}  {3:8s}  {4:8s} {5:8s} {6:8s} {7:1.3f}\n".format(
-            self.name,
-            self.distance,
-            str(self.crystal),
-            str(self.symmetry),
-            str(self.slicing),
-            str(self.show_edge),
-            str(self.boundary),
-            self.width,
+        s += (
+            f"{self.name:10s}   {self.distance:1.3f}  {str(self.crystal):8s}  "
+            f"{str(self.symmetry):8s}  {str(self.slicing):8s} "
+            f"{str(self.show_edge):8s} {str(self.boundary):8s} {self.width:1.3f}\n"
         )
         s += "-" * 60 + "\n"
         return s
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -16,34 +17,34 @@ class PolyhedraSetting(Base):
     flag: BoolProperty(name="flag", default=False)
     label: StringProperty(name="label", default="")
     species: StringProperty(name="species")
-    name: StringProperty(name="name")
     color: FloatVectorProperty(name="color", subtype="COLOR", min=0, max=1, size=4)
     width: FloatProperty(name="width", min=0, soft_max=1, default=0.01)
     show_edge: BoolProperty(name="show_edge", default=True)
 
+    _FIELDS = (
+        "flag",
+        "label",
+        "species",
+        "name",
+        "material_style",
+        "color",
+        "width",
+        "show_edge",
+    )
+    _values = attrgetter(*_FIELDS)
+
     @property
     def name(self) -> str:
         return self.species
 
     def as_dict(self) -> dict:
-        setdict = {
-            "flag": self.flag,
-            "label": self.label,
-            "species": self.species,
-            "name": self.name,
-            "material_style": self.material_style,
-            "color": self.color[:],
-            "width": self.width,
-            "show_edge": self.show_edge,
-        }
+        setdict = dict(zip(self._FIELDS, self._values(self)))
+        setdict["color"] = self.color[:]
         return setdict
 
     def __repr__(self) -> str:
-        s = "-" * 60 + "\n"
         s = "Center                show_edge           width \n"
-        s += "{0:10s}    {1:10s}   {2:1.3f} \n".format(
-            self.species, str(self.show_edge), self.width
-        )
+        s += f"{self.species:10s}    {str(self.show_edge):10s}   {self.width:1.3f} \n"
         s += "-" * 60 + "\n"
         return s
 
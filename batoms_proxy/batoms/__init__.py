@@ -3,16 +3,21 @@
 
 This proxy only redirectly itself to the active batoms extension if one is found, and does not change the sys.path
 """
-import importlib
 import sys
 
-try:
-    import addon_utils
-except ModuleNotFoundError:
-    raise ImportError(
-        "`addon_utils` cannot be imported. "
-        "Make sure you're using Blender's Python interpreter."
-    )
+
+def _enabled_addons():
+    """Snapshot the module names of all enabled add-ons and extensions.
+
+    Returns None if the preferences are not accessible, e.g. when the
+    context is not yet initialized in background mode.
+    """
+    try:
+        import bpy
+
+        return {addon.module for addon in bpy.context.preferences.addons}
+    except (ImportError, AttributeError):
+        return None
 
 
 class _BatomsProxy:
@@ -41,7 +46,13 @@ class _BatomsProxy:
         Raises:
             ImportError: If no valid module is found or if multiple exist.
         """
-        possible_modules = []
+        try:
+            import addon_utils
+        except ModuleNotFoundError:
+            raise ImportError(
+                "`addon_utils` cannot be imported. "
+                "Make sure you're using Blender's Python interpreter."
+            )
 
         # Get the list of available Blender extensions
         addons = addon_utils.modules()
@@ -50,11 +61,17 @@ class _BatomsProxy:
                 "Blender extension system is unavailable. Ensure that Blender is running."
             )
 
-        for addon in addons:
-            importable_name = addon.__name__
-
-            # Ensure the module ends with ".batoms"
-            if importable_name.endswith(f".{self.extension_name}"):
+        # Ensure the module ends with ".batoms"
+        suffix = f".{self.extension_name}"
+        candidates = [
+            addon.__name__ for addon in addons if addon.__name__.endswith(suffix)
+        ]
+        enabled = _enabled_addons()
+        if enabled is not None:
+            possible_modules = [name for name in candidates if name in enabled]
+        else:
+            possible_modules = []
+            for importable_name in candidates:
                 # At least loaded_state must be true
                 loaded_default, loaded_state = addon_utils.check(importable_name)
                 if loaded_state:
@@ -75,13 +92,20 @@ class _BatomsProxy:
         return possible_modules[0]  # The correct module name
 
     def _load_module(self):
-        """Load the real `batoms` module dynamically when accessed."""
+        """Load the real `batoms` module dynamically when accessed.
+
+        Once resolved, the real module replaces the proxy in `sys.modules`,
+        so that subsequent `import batoms` statements bypass the proxy.
+        """
         if self._module is not None:
             return  # Prevent infinite recursion
 
+        import importlib
+
         module_name = self._find_extension_module()
         self._module = importlib.import_module(module_name)
         self._resolved_name = module_name
+        sys.modules[__name__] = self._module
 
     def __getattr__(self, name):
         """Dynamically forward attribute access to `bl_ext.<channel>.batoms`."""
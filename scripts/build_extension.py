@@ -11,6 +11,15 @@ Additionally, the following tools may be required:
 Usage:
     blender -b -P build_extension.py -- --repo-root . --build-dir build \
         --export-dir export --allow-overwrite
+
+Wheels of Blender's bundled packages are kept in <build-dir>/wheels between
+runs, together with `.manifest.json` (pinned package -> wheel file) and
+`.cache.json` (installed packages keyed on site-packages mtime). CI can
+persist that directory as a cache to skip rebuilding those wheels.
+All built wheels are also collected in ~/.cache/batoms-wheelhouse, which pip
+searches first. With --offline, pip resolves from that wheelhouse only and
+builds without isolation, so the build requirements of batoms (setuptools,
+wheel) must be installed in Blender's Python.
 """
 
 import subprocess
@@ -18,17 +27,66 @@ import sys
 import os
 import shutil
 import tempfile
-import toml
-import site
 import warnings
 import argparse
-import requests
-import tarfile
+import zipfile
+import json
+import re
+import hashlib
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from pip._internal.operations.freeze import freeze
-from pip._internal.commands.wheel import WheelCommand
 
 PYTHON_FTP_BASE = "https://www.python.org/ftp/python/"
+# Records which wheel in build/wheels belongs to which pinned package
+WHEELS_MANIFEST = ".manifest.json"
+# Caches the installed packages of Blender's site-packages
+PACKAGES_CACHE = ".cache.json"
+# Packaging tools that are never shipped as extension wheels
+EXCLUDED_PACKAGES = frozenset(("pip", "wheel", "setuptools", "distribute"))
+# Persistent pip cache shared by all builds
+PIP_CACHE_DIR = Path.home() / ".cache" / "batoms-wheels"
+# Local wheelhouse searched by pip before the package index
+WHEELHOUSE_DIR = Path.home() / ".cache" / "batoms-wheelhouse"
+
+
+def load_toml(path):
+    """Parse a toml file with rtoml if installed, otherwise the stdlib tomllib."""
+    try:
+        import rtoml
+
+        return rtoml.loads(Path(path).read_text())
+    except ModuleNotFoundError:
+        pass
+    try:
+        import tomllib
+
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except ModuleNotFoundError:  # Python < 3.11
+        import toml
+
+        with open(path, "r") as f:
+            return toml.load(f)
+
+
+def dumps_toml(data):
+    """Serialize data to a toml string with rtoml if installed, otherwise tomli_w."""
+    try:
+        import rtoml
+
+        return rtoml.dumps(data)
+    except ModuleNotFoundError:
+        pass
+    try:
+        import tomli_w
+
+        return tomli_w.dumps(data)
+    except ModuleNotFoundError:
+        import toml
+
+        return toml.dumps(data)
 
 
 def get_blender_python_version():
@@ -46,6 +104,9 @@ def get_blender_python_version():
 
 def download_and_extract_python_headers():
     """Download and extract the exact Python source matching Blender's Python version."""
+    import requests
+    import tarfile
+
     python_version = get_blender_python_version()
     print(f"Looking for Python header version {python_version}")
     base_url = "https://www.python.org/ftp/python/"
@@ -119,32 +180,161 @@ def get_blender_bin():
     return blender_bin
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a real copy.
+
+    An existing dst is removed first so that a stale hardlink is never
+    written through into the source tree.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # e.g. cross-device link or filesystem without hardlink support
+        shutil.copy2(src, dst)
+    return dst
+
+
+def stage_source_code(source_code, target):
+    """Expose source_code at target without copying the whole tree.
+
+    A directory symlink is used when possible. Where symlinks are not
+    permitted (e.g. Windows without developer mode), fall back to a
+    hardlink-based copy.
+    """
+    source_code = Path(source_code).resolve()
+    try:
+        os.symlink(source_code, target, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        shutil.copytree(source_code, target, copy_function=_link_or_copy)
+    return target
+
+
+@cache
 def get_blender_site_packages():
-    """Retrieve Blender's default site-packages directory."""
+    """Retrieve Blender's default site-packages directory.
+
+    The result is cached, so the warning below is emitted at most once.
+    A tuple is returned so that callers cannot modify the cached value.
+    """
+    import site
+
     site_packages = site.getsitepackages()
     if len(site_packages) > 1:
         warnings.warn(
             "Multiple site-packages directories found. " "Using the first one."
         )
-    return [site_packages[0]]
+    return (site_packages[0],)
+
+
+def _is_editable(dist):
+    """Check if a distribution is an editable install (PEP 610)."""
+    direct_url = dist.read_text("direct_url.json")
+    if not direct_url:
+        return False
+    return json.loads(direct_url).get("dir_info", {}).get("editable", False)
 
 
-def get_installed_packages():
-    """Retrieve installed packages within Blender's Python environment."""
+def _egg_link_names(paths):
+    """Canonical names of legacy `setup.py develop` editables (*.egg-link)."""
+    return {
+        _canonical_name(link.stem)
+        for path in paths
+        for link in Path(path).glob("*.egg-link")
+    }
+
+
+def get_installed_packages(names=None):
+    """Retrieve installed packages within Blender's Python environment.
+
+    The metadata of Blender's site-packages is read directly instead of
+    going through `pip freeze`. The scan is cached, and each call returns
+    a new dict.
+
+    Args:
+        names (iterable, optional): Only collect these packages, and stop
+            scanning once all of them are found. Defaults to all packages.
+    """
+    if names is not None:
+        names = frozenset(_canonical_name(name) for name in names)
+    return dict(_scan_installed_packages(names))
+
+
+@lru_cache(maxsize=8)
+def _scan_installed_packages(names):
+    from importlib.metadata import distributions
+
     pkg_dict = {}
-    for pkg in freeze(
-        isolated=True, exclude_editable=True, paths=get_blender_site_packages()
-    ):
-        pkg_name, version = pkg.split("==")
-        if pkg_name not in {"pip", "wheel", "setuptools", "distribute"}:
-            pkg_dict[pkg_name] = version
+    needed = set(names) if names is not None else None
+    site_packages = get_blender_site_packages()
+    egg_links = _egg_link_names(site_packages)
+    for dist in distributions(path=site_packages):
+        pkg_name = dist.metadata["Name"]
+        if pkg_name is None or pkg_name in pkg_dict:
+            continue
+        if pkg_name.lower() in EXCLUDED_PACKAGES:
+            continue
+        canonical_name = _canonical_name(pkg_name)
+        if needed is not None:
+            if canonical_name not in needed:
+                continue
+            needed.discard(canonical_name)
+        # Skip editable installs, like `pip freeze --exclude-editable`: legacy
+        # egg-links, and PEP 610 ones whose direct_url.json is read for every
+        # remaining package
+        if canonical_name not in egg_links and not _is_editable(dist):
+            pkg_dict[pkg_name] = dist.version
+        if needed is not None and len(needed) == 0:
+            break
     return pkg_dict
 
 
+def _site_packages_key():
+    """Hash the modification times of Blender's site-packages directories."""
+    stamps = sorted(
+        (path, os.stat(path).st_mtime_ns) for path in get_blender_site_packages()
+    )
+    return hashlib.sha1(repr(stamps).encode()).hexdigest()
+
+
+def load_installed_packages(cache_path):
+    """Same as get_installed_packages, but persisted to cache_path.
+
+    The cache is reused as long as the site-packages directories
+    have not been modified since it was written.
+    """
+    cache_path = Path(cache_path)
+    key = _site_packages_key()
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+        if cache.get("key") == key:
+            return cache["packages"]
+    except (OSError, ValueError, KeyError):
+        pass
+    packages = get_installed_packages()
+    with open(cache_path, "w") as f:
+        json.dump({"key": key, "packages": packages}, f, indent=2)
+    return packages
+
+
+# Matches the `blender-extension = [...]` array of the optional dependencies
+BLENDER_EXTENSION_PATTERN = re.compile(
+    r"^blender-extension\s*=\s*\[[^\]]*\]", flags=re.MULTILINE
+)
+
+
 def generate_updated_pyproject(pyproject_path, existing_packages):
-    """Modify the `blender-extension` optional dependencies in pyproject.toml."""
-    with open(pyproject_path, "r") as f:
-        pyproject = toml.load(f)
+    """Modify the `blender-extension` optional dependencies in pyproject.toml.
+
+    Only the `blender-extension` array is rewritten in the original text,
+    keeping the comments and formatting of the rest of the file.
+
+    Returns:
+        str: The content of the updated pyproject.toml.
+    """
+    pyproject = load_toml(pyproject_path)
 
     if "blender-extension" not in pyproject.get("project", {}).get(
         "optional-dependencies", {}
@@ -154,11 +344,166 @@ def generate_updated_pyproject(pyproject_path, existing_packages):
             "Ensure you're using the latest version."
         )
 
-    pyproject["project"]["optional-dependencies"]["blender-extension"] = [
-        f"{pkg}=={ver}" for pkg, ver in existing_packages.items()
+    requirements = "".join(
+        f'    "{pkg}=={ver}",\n' for pkg, ver in existing_packages.items()
+    )
+    text, count = BLENDER_EXTENSION_PATTERN.subn(
+        lambda _: f"blender-extension = [\n{requirements}]",
+        Path(pyproject_path).read_text(),
+        count=1,
+    )
+    if count == 0:
+        raise ValueError(
+            "Cannot locate the `blender-extension = [...]` array in pyproject.toml."
+        )
+    return text
+
+
+def get_pip_options(index_url=None, no_build_isolation=False, offline=False):
+    """Options shared by all `pip wheel` invocations.
+
+    offline implies no_build_isolation: the isolated build environment
+    would need setuptools and wheel from the index, and these are never
+    saved to the wheelhouse.
+    """
+    WHEELHOUSE_DIR.mkdir(parents=True, exist_ok=True)
+    options = [
+        "--cache-dir",
+        PIP_CACHE_DIR.as_posix(),
+        "--find-links",
+        WHEELHOUSE_DIR.as_posix(),
+        "--prefer-binary",
     ]
+    if offline:
+        options += ["--no-index"]
+    elif index_url:
+        options += ["--index-url", str(index_url)]
+    if no_build_isolation or offline:
+        options += ["--no-build-isolation"]
+    return options
+
+
+def update_wheelhouse(wheels_dir, wheelhouse=WHEELHOUSE_DIR):
+    """Add the newly built wheels to the local wheelhouse.
+
+    The batoms wheel itself is skipped since it is always rebuilt from source.
+    """
+    wheelhouse = Path(wheelhouse)
+    existing = _scan_wheels(wheelhouse)
+    for name, path in _scan_wheels(wheels_dir).items():
+        if name in existing or name.startswith("batoms-"):
+            continue
+        _link_or_copy(path, wheelhouse / name)
+    return
+
+
+def prefetch_wheels(packages, wheels_dir, pip_options=(), max_workers=None):
+    """Build wheels of pinned packages concurrently into wheels_dir.
+
+    The packages are split into pinned requirement files, each handled by a
+    separate `pip wheel --no-deps` process, since the pinned list from
+    Blender's site-packages is already complete.
+    """
+    wheels_dir = Path(wheels_dir)
+    specs = [f"{pkg}=={ver}" for pkg, ver in packages.items()]
+    if len(specs) == 0:
+        return
+    num_workers = min(len(specs), max_workers or os.cpu_count() or 1)
+
+    def _run(requirements):
+        commands = [
+            sys.executable,
+            "-m",
+            "pip",
+            "wheel",
+            "--no-input",
+            "--no-deps",
+            "--wheel-dir",
+            wheels_dir.as_posix(),
+            *pip_options,
+            "--requirement",
+            requirements.as_posix(),
+        ]
+        subprocess.run(commands, check=True)
+
+    print(f"Prefetching {len(specs)} wheels with {num_workers} workers")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        requirement_files = []
+        for i in range(num_workers):
+            requirements = Path(tmpdir) / f"requirements-{i}.txt"
+            requirements.write_text("\n".join(specs[i::num_workers]) + "\n")
+            requirement_files.append(requirements)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(_run, requirement_files))
+    return
+
+
+def _canonical_name(name):
+    """Normalize a distribution name according to PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _wheel_spec(wheel_name):
+    """Return the normalized `name==version` of a wheel file name."""
+    name, version = wheel_name.split("-")[:2]
+    return f"{_canonical_name(name)}=={version}"
+
+
+def get_interpreter_tag():
+    """Identify the interpreter and platform the cached wheels were built for."""
+    return f"{sys.implementation.cache_tag}-{sysconfig.get_platform()}"
+
+
+def load_wheels_manifest(wheels_dir, tag=None):
+    """Load the mapping of pinned `name==version` to cached wheel file names.
+
+    The mapping is discarded if it was saved for another interpreter tag.
+    """
+    tag = tag or get_interpreter_tag()
+    manifest_path = Path(wheels_dir) / WHEELS_MANIFEST
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("tag") != tag:
+        return {}
+    return manifest.get("wheels", {})
+
+
+def save_wheels_manifest(wheels_dir, wheels, tag=None):
+    """Save the mapping of pinned `name==version` to cached wheel file names."""
+    manifest = {"tag": tag or get_interpreter_tag(), "wheels": wheels}
+    with open(Path(wheels_dir) / WHEELS_MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return
 
-    return pyproject
+
+def reuse_cached_wheels(wheels_dir, pinned, tag=None):
+    """Keep the cached wheels of the pinned specs and remove all other wheels.
+
+    Args:
+        wheels_dir (str, Path): Directory holding the wheels and manifest.
+        pinned (iterable): Normalized `name==version` specs to keep.
+        tag (str, optional): Interpreter tag, see get_interpreter_tag.
+
+    Returns:
+        dict: Mapping of the reused specs to their wheel file names.
+    """
+    wheels_dir = Path(wheels_dir)
+    pinned = set(pinned)
+    cached = {
+        spec: wheel
+        for spec, wheel in load_wheels_manifest(wheels_dir, tag).items()
+        if spec in pinned and (wheels_dir / wheel).is_file()
+    }
+    cached_wheels = set(cached.values())
+    for f in wheels_dir.glob("*.whl"):
+        if f.name not in cached_wheels:
+            f.unlink()
+    return cached
 
 
 def build_wheels(
@@ -167,27 +512,47 @@ def build_wheels(
     build_dir="build",
     index_url=None,
     extra_wheels_dirs=[],
+    no_build_isolation=False,
+    offline=False,
 ):
     """Build wheels for the extension, including Blender-installed packages.
     The build_wheels command will also pack batoms itself into a wheel!
     """
+    os.environ.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
+    pip_options = get_pip_options(index_url, no_build_isolation, offline)
     build_dir = Path(build_dir)
     source_code_origin = Path(source_code)
     pyproject_origin = Path(pyproject)
 
-    existing_packages = get_installed_packages()
-
-    # Clear previous wheels
+    # Keep wheels of pinned packages from previous builds, clear the others
     wheels_dir = build_dir / "wheels"
     wheels_dir.mkdir(parents=True, exist_ok=True)
-    for f in wheels_dir.glob("*.whl"):
-        f.unlink()
+    existing_packages = load_installed_packages(wheels_dir / PACKAGES_CACHE)
+    pinned = {
+        f"{_canonical_name(pkg)}=={ver}": pkg for pkg, ver in existing_packages.items()
+    }
+    cached = reuse_cached_wheels(wheels_dir, pinned)
+    missing = {
+        pinned[spec]: existing_packages[pinned[spec]]
+        for spec in pinned
+        if spec not in cached
+    }
+    print(f"{len(cached)} cached wheels reused, {len(missing)} to prefetch")
+    before = set(_scan_wheels(wheels_dir))
+    prefetch_wheels(missing, wheels_dir, pip_options=pip_options)
+    for wheel in set(_scan_wheels(wheels_dir)) - before:
+        spec = _wheel_spec(wheel)
+        if spec in pinned:
+            cached[spec] = wheel
+    save_wheels_manifest(wheels_dir, cached)
 
     # Temporary build environment
-    with tempfile.TemporaryDirectory() as tmpdir:
+    # Created under build_dir so the hardlink fallback of stage_source_code
+    # stays on the same filesystem as the sources
+    with tempfile.TemporaryDirectory(dir=build_dir) as tmpdir:
         tmpdir = Path(tmpdir)
         source_code_target = tmpdir / source_code_origin.name
-        shutil.copytree(source_code_origin, source_code_target)
+        stage_source_code(source_code_origin, source_code_target)
 
         # Update pyproject.toml
         updated_pyproject = generate_updated_pyproject(
@@ -196,26 +561,28 @@ def build_wheels(
         pyproject_target = tmpdir / pyproject_origin.name
         print(pyproject_target)
         with open(pyproject_target, "w") as f:
-            toml.dump(updated_pyproject, f)
+            f.write(updated_pyproject)
 
-        # Run pip wheel builder
-        wc = WheelCommand("wheel", "Download wheels for Blender extension")
+        # Run pip wheel builder in a separate process
         options = [
             "--wheel-dir",
             wheels_dir.as_posix(),
+            "--find-links",
+            wheels_dir.as_posix(),
             "-e",
             tmpdir.as_posix() + "[blender-extension]",
-        ]
-        if index_url:
-            options += ["--index-url", str(index_url)]
+        ] + pip_options
 
         print(f"Running: pip wheel {' '.join(options)}")
-        retcode = wc.main(options)
+        retcode = subprocess.run(
+            [sys.executable, "-m", "pip", "wheel", "--no-input", *options]
+        ).returncode
         print(f"Pip returns code {retcode}")
         if retcode != 0:
             raise RuntimeError(f"Pip wheel failed with code {retcode}")
 
     print(f"Build completed. Wheels saved in {wheels_dir}")
+    update_wheelhouse(wheels_dir)
     merge_wheels(wheels_dir, extra_wheels_dirs)
     return
 
@@ -232,7 +599,19 @@ def compress_wheels(build_dir, export_dir):
         raise FileNotFoundError("No wheels found in build directory.")
 
     zip_path = export_dir / f"batoms-wheels-{get_platform_string(connector='_')}.zip"
-    shutil.make_archive(zip_path.with_suffix(""), "zip", wheels_dir)
+    # Wheels are already zip-compressed, store them as-is
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(wheels_dir.rglob("*")):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            compress_type = (
+                zipfile.ZIP_STORED if path.suffix == ".whl" else zipfile.ZIP_DEFLATED
+            )
+            zf.write(
+                path,
+                path.relative_to(wheels_dir).as_posix(),
+                compress_type=compress_type,
+            )
     print(f"Compressed wheels saved at: {zip_path}")
     return
 
@@ -247,15 +626,14 @@ def update_blender_manifest(build_dir="build", manifest="blender_manifest.toml")
         f.relative_to(build_dir).as_posix() for f in wheels_dir.glob("*.whl")
     ]
 
-    with open(manifest_path, "r") as f:
-        manifest_data = toml.load(f)
+    manifest_data = load_toml(manifest_path)
 
     manifest_data["wheels"] = wheels_list
     toml_header = (
         "# blender_manifest.toml generated by build_extension.py, "
         "please do not modify the wheels field.\n"
     )
-    manifest_str = toml_header + toml.dumps(manifest_data)
+    manifest_str = toml_header + dumps_toml(manifest_data)
 
     with open(build_dir / "blender_manifest.toml", "w") as f:
         f.write(manifest_str)
@@ -270,10 +648,22 @@ def copy_source_code(source_code="batoms", build_dir="build"):
     build_dir = Path(build_dir)
     if not source_code.exists():
         raise FileNotFoundError(f"Source directory {source_code} does not exist.")
-    shutil.copytree(source_code, build_dir, dirs_exist_ok=True)
+    shutil.copytree(
+        source_code, build_dir, dirs_exist_ok=True, copy_function=_link_or_copy
+    )
     return
 
 
+def _scan_wheels(directory):
+    """Map wheel file names to their paths in a single directory scan."""
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry.path
+            for entry in entries
+            if entry.name.endswith(".whl") and entry.is_file()
+        }
+
+
 def merge_wheels(wheels_dir, extra_wheels_dirs):
     """Merge additional wheels from other platforms into the primary wheels directory."""
     wheels_dir = Path(wheels_dir)
@@ -289,9 +679,11 @@ def merge_wheels(wheels_dir, extra_wheels_dirs):
             )
 
     # Ensure all directories contain the same number of wheels
-    num_current_wheels = len(list(wheels_dir.glob("*.whl")))
-    for extra_dir in extra_wheels_dirs:
-        wheel_count = len(list(extra_dir.glob("*.whl")))
+    current_wheels = _scan_wheels(wheels_dir)
+    num_current_wheels = len(current_wheels)
+    extra_wheels = [_scan_wheels(extra_dir) for extra_dir in extra_wheels_dirs]
+    for extra_dir, wheels in zip(extra_wheels_dirs, extra_wheels):
+        wheel_count = len(wheels)
         if num_current_wheels != wheel_count:
             raise ValueError(
                 f"The number of wheels in {extra_dir} "
@@ -300,22 +692,31 @@ def merge_wheels(wheels_dir, extra_wheels_dirs):
             )
 
     # Merge wheels while avoiding duplicates
-    for extra_dir in extra_wheels_dirs:
-        for wheel in extra_dir.glob("*.whl"):
-            target_path = wheels_dir / wheel.name
-            if not target_path.exists():
-                shutil.copy2(wheel, wheels_dir)
-                print(f"Merged {wheel.name} from {extra_dir} --> {wheels_dir}")
+    current_names = set(current_wheels)
+    for extra_dir, wheels in zip(extra_wheels_dirs, extra_wheels):
+        for name in sorted(wheels.keys() - current_names):
+            shutil.copy2(wheels[name], wheels_dir / name)
+            current_names.add(name)
+            print(f"Merged {name} from {extra_dir} --> {wheels_dir}")
     return
 
 
-def clear_dirs(*dirs):
-    """Delete specified directories and recreate them."""
+def clear_dirs(*dirs, preserve=("wheels",)):
+    """Empty the specified directories, creating them if needed.
+
+    Children whose names are in `preserve` are kept, so that the
+    wheels cache survives between builds.
+    """
     for directory in dirs:
         directory = Path(directory)
-        if directory.exists():
-            shutil.rmtree(directory)
         directory.mkdir(parents=True, exist_ok=True)
+        for child in directory.iterdir():
+            if child.name in preserve:
+                continue
+            if child.is_dir() and not child.is_symlink():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
     return
 
 
@@ -397,6 +798,25 @@ def main():
         action="store_true",
         help="Only compress the wheels without building the extension.",
     )
+    parser.add_argument(
+        "--no-build-isolation",
+        action="store_true",
+        help="Pass --no-build-isolation to pip when all build dependencies are installed.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=(
+            "Resolve wheels from the local wheelhouse only (pip --no-index). "
+            "Implies --no-build-isolation, so setuptools and wheel must be "
+            "installed in Blender's Python."
+        ),
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Also remove the cached wheels from previous builds.",
+    )
     parser.add_argument(
         "--download-python-headers",
         action="store_true",
@@ -425,7 +845,7 @@ def main():
 
     try:
         # import pdb; pdb.set_trace()
-        clear_dirs(build_dir, export_dir)
+        clear_dirs(build_dir, export_dir, preserve=() if args.clean else ("wheels",))
         copy_source_code(source_code, build_dir)
         build_wheels(
             source_code,
@@ -433,6 +853,8 @@ def main():
             build_dir,
             index_url=args.index_url,
             extra_wheels_dirs=extra_wheels,
+            no_build_isolation=args.no_build_isolation,
+            offline=args.offline,
         )
         if args.only_compress_wheels:
             if len(extra_wheels) > 0:
@@ -0,0 +1,207 @@
+"""Tests for the wheel cache helpers of scripts/build_extension.py.
+These helpers do not depend on bpy.
+"""
+import json
+import sys
+from pathlib import Path
+
+curdir = Path(__file__).parent.resolve()
+sys.path.append((curdir.parent / "scripts").as_posix())
+
+
+def _touch_wheels(directory, names):
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_bytes(b"")
+
+
+def test_wheel_spec():
+    from build_extension import _wheel_spec
+
+    assert _wheel_spec("numpy-1.26.4-cp311-cp311-linux_x86_64.whl") == "numpy==1.26.4"
+    assert _wheel_spec("Zope.Interface-6.0-py3-none-any.whl") == "zope-interface==6.0"
+
+
+def test_clear_dirs_preserve(tmp_path):
+    from build_extension import clear_dirs
+
+    _touch_wheels(tmp_path / "wheels", ["a-1.0-py3-none-any.whl"])
+    (tmp_path / "batoms").mkdir()
+    (tmp_path / "blender_manifest.toml").write_text("")
+    clear_dirs(tmp_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["wheels"]
+    assert (tmp_path / "wheels" / "a-1.0-py3-none-any.whl").is_file()
+    clear_dirs(tmp_path, preserve=())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_reuse_cached_wheels(tmp_path):
+    from build_extension import reuse_cached_wheels, save_wheels_manifest
+
+    wheels = {
+        "numpy==1.26.4": "numpy-1.26.4-cp311-cp311-linux_x86_64.whl",
+        "zstandard==0.16.0": "zstandard-0.16.0-cp311-cp311-linux_x86_64.whl",
+        "idna==3.4": "idna-3.4-py3-none-any.whl",
+    }
+    # idna is in the manifest but its file is missing
+    _touch_wheels(
+        tmp_path,
+        [
+            wheels["numpy==1.26.4"],
+            wheels["zstandard==0.16.0"],
+            "ase-3.23.0-py3-none-any.whl",
+        ],
+    )
+    save_wheels_manifest(tmp_path, wheels, tag="cpython-311-linux-x86_64")
+    cached = reuse_cached_wheels(
+        tmp_path, ["numpy==1.26.4", "idna==3.4"], tag="cpython-311-linux-x86_64"
+    )
+    assert cached == {"numpy==1.26.4": wheels["numpy==1.26.4"]}
+    assert sorted(p.name for p in tmp_path.glob("*.whl")) == [wheels["numpy==1.26.4"]]
+
+
+def test_reuse_cached_wheels_tag_mismatch(tmp_path):
+    from build_extension import reuse_cached_wheels, save_wheels_manifest
+
+    wheel = "numpy-1.26.4-cp311-cp311-linux_x86_64.whl"
+    _touch_wheels(tmp_path, [wheel])
+    save_wheels_manifest(
+        tmp_path, {"numpy==1.26.4": wheel}, tag="cpython-311-linux-x86_64"
+    )
+    cached = reuse_cached_wheels(
+        tmp_path, ["numpy==1.26.4"], tag="cpython-311-macosx-11.0-arm64"
+    )
+    assert cached == {}
+    assert list(tmp_path.glob("*.whl")) == []
+
+
+def test_load_wheels_manifest_legacy_format(tmp_path):
+    from build_extension import load_wheels_manifest, WHEELS_MANIFEST
+
+    # Flat mapping written before the interpreter tag was recorded
+    legacy = {"numpy==1.26.4": "numpy-1.26.4-cp311-cp311-linux_x86_64.whl"}
+    (tmp_path / WHEELS_MANIFEST).write_text(json.dumps(legacy))
+    assert load_wheels_manifest(tmp_path) == {}
+
+
+def test_generate_updated_pyproject(tmp_path):
+    import tomllib
+    from build_extension import generate_updated_pyproject
+
+    pyproject_path = tmp_path / "pyproject.toml"
+    original = (curdir.parent / "pyproject.toml").read_text()
+    pyproject_path.write_text(original)
+    text = generate_updated_pyproject(
+        pyproject_path, {"numpy": "1.24.3", "zstandard": "0.16.0"}
+    )
+    data = tomllib.loads(text)
+    assert data["project"]["optional-dependencies"]["blender-extension"] == [
+        "numpy==1.24.3",
+        "zstandard==0.16.0",
+    ]
+    # Everything outside the array is kept verbatim
+    head, tail = original.split("blender-extension = []")
+    assert text.startswith(head)
+    assert text.endswith(tail)
+
+
+def test_generate_updated_pyproject_existing_array(tmp_path):
+    import tomllib
+    from build_extension import generate_updated_pyproject
+
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text(
+        '[project]\nname = "batoms"\n\n'
+        "[project.optional-dependencies]\n"
+        'blender-extension = [\n    "numpy==1.24.3",\n    "requests==2.31.0",\n]\n'
+        'tests = ["pytest"]\n'
+    )
+    text = generate_updated_pyproject(pyproject_path, {"numpy": "1.26.4"})
+    optional = tomllib.loads(text)["project"]["optional-dependencies"]
+    assert optional["blender-extension"] == ["numpy==1.26.4"]
+    assert optional["tests"] == ["pytest"]
+
+
+def test_generate_updated_pyproject_errors(tmp_path):
+    import pytest
+    from build_extension import generate_updated_pyproject
+
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text('[project]\nname = "batoms"\n')
+    with pytest.raises(ValueError, match="not found"):
+        generate_updated_pyproject(pyproject_path, {})
+    # Valid TOML, but not in the `blender-extension = [...]` form
+    pyproject_path.write_text(
+        '[project]\nname = "batoms"\n'
+        'optional-dependencies = { blender-extension = ["numpy==1.24.3"] }\n'
+    )
+    with pytest.raises(ValueError, match="Cannot locate"):
+        generate_updated_pyproject(pyproject_path, {"numpy": "1.26.4"})
+
+
+def _fake_site_packages(directory, names):
+    for name, version in names:
+        dist_info = directory / f"{name}-{version}.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        )
+
+
+def test_get_installed_packages(tmp_path, monkeypatch):
+    import build_extension
+
+    _fake_site_packages(
+        tmp_path,
+        [
+            ("Zope.Interface", "6.0"),
+            ("numpy", "1.24.3"),
+            ("pip", "23.2.1"),
+            ("setuptools", "68.0.0"),
+        ],
+    )
+    monkeypatch.setattr(
+        build_extension, "get_blender_site_packages", lambda: (tmp_path.as_posix(),)
+    )
+    build_extension._scan_installed_packages.cache_clear()
+    try:
+        packages = build_extension.get_installed_packages()
+        assert packages == {"Zope.Interface": "6.0", "numpy": "1.24.3"}
+        # Names are matched after PEP 503 normalization
+        assert build_extension.get_installed_packages(["zope_interface"]) == {
+            "Zope.Interface": "6.0"
+        }
+        assert build_extension.get_installed_packages(["pip", "NumPy"]) == {
+            "numpy": "1.24.3"
+        }
+        # Mutating a result does not corrupt the cached scan
+        packages["numpy"] = "0.0"
+        packages["batoms"] = "2.3.0"
+        assert build_extension.get_installed_packages() == {
+            "Zope.Interface": "6.0",
+            "numpy": "1.24.3",
+        }
+    finally:
+        build_extension._scan_installed_packages.cache_clear()
+
+
+def test_get_installed_packages_skips_editables(tmp_path, monkeypatch):
+    import build_extension
+
+    _fake_site_packages(
+        tmp_path, [("numpy", "1.24.3"), ("batoms", "2.3.0"), ("my_tool", "0.1")]
+    )
+    # PEP 610 editable install
+    (tmp_path / "batoms-2.3.0.dist-info" / "direct_url.json").write_text(
+        json.dumps({"url": "file:///src/batoms", "dir_info": {"editable": True}})
+    )
+    # Legacy `setup.py develop` install
+    (tmp_path / "my-tool.egg-link").write_text("/src/my_tool\n.\n")
+    monkeypatch.setattr(
+        build_extension, "get_blender_site_packages", lambda: (tmp_path.as_posix(),)
+    )
+    build_extension._scan_installed_packages.cache_clear()
+    try:
+        assert build_extension.get_installed_packages() == {"numpy": "1.24.3"}
+    finally:
+        build_extension._scan_installed_packages.cache_clear()